@@ -42,6 +42,7 @@ class DpfJob(DpfServer):
         self.sm_url = service_manager_url
         self.job_name = job_name
         super().channel = channel
+        self._clear_caches()
 
     def shutdown(self):
         requests.delete(url=f"{self.sm_url}/jobs/{self.job_name}")
@@ -367,6 +367,7 @@ class BaseService:
                 f'Unable to load library "{filename}". File may not exist or'
                 f" is missing dependencies:\n{str(e)}"
             )
+        self._server()._clear_caches()
 
         # TODO: fix code generation upload posix
         import os
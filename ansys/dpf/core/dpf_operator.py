@@ -74,12 +74,6 @@ class Operator:
 
         self.__send_init_request(config)
 
-        # add dynamic inputs
-        if len(self._message.spec.map_input_pin_spec) > 0 and self._inputs == None:
-            self._inputs = Inputs(self._message.spec.map_input_pin_spec, self)
-        if len(self._message.spec.map_output_pin_spec) != 0 and self._outputs == None:
-            self._outputs = Outputs(self._message.spec.map_output_pin_spec, self)
-
         self._description = self._message.spec.description
 
     def _add_sub_res_operators(self, sub_results):
@@ -227,7 +221,10 @@ class Operator:
         >>> disp_op.inputs.data_sources(data_src)
 
         """
-
+        # dynamic inputs are built on first access, operators generated
+        # in ansys.dpf.core.operators set their own
+        if self._inputs is None and len(self._message.spec.map_input_pin_spec) > 0:
+            self._inputs = Inputs(self._message.spec.map_input_pin_spec, self)
         return self._inputs
 
     @property
@@ -251,6 +248,8 @@ class Operator:
         >>> disp_fc = disp_op.outputs.fields_container()
 
         """
+        if self._outputs is None and len(self._message.spec.map_output_pin_spec) > 0:
+            self._outputs = Outputs(self._message.spec.map_output_pin_spec, self)
         return self._outputs
 
     @staticmethod
@@ -481,25 +481,50 @@ class _FieldBase:
         if self._message.datatype == "int":
             if not isinstance(data[0], int) and not isinstance(data[0], np.int32):
                 raise errors.InvalidTypeError("data", "list of int")
-            data = np.array(data, dtype=np.int32)
+            data = np.array(data, dtype=np.int32).ravel()
             metadata = [("size_int", f"{len(data)}")]
+            self._update_data(data, metadata)
         else:
-            if isinstance(data, (np.ndarray, np.generic)):
-                if (
-                    0 != self.size
-                    and self.component_count > 1
-                    and data.size // self.component_count
-                    != data.size / self.component_count
-                ):
-                    raise ValueError(
-                        f"An array of shape {self.shape} is expected and "
-                        f"shape {data.shape} was input"
-                    )
-                else:
-                    data = np.array(data.reshape(data.size), dtype=float)
-            else:
-                data = np.array(data, dtype=float)
-            metadata = [("float_or_double", "double"), ("size_double", f"{len(data)}")]
+            self._set_double_data(data)
+
+    def _set_double_data(self, data, data_size=None):
+        """Stream ``data`` to the server as the double data of the field.
+
+        Parameters
+        ----------
+        data : list, numpy.ndarray
+            Flat or entity-shaped data.
+        data_size : int, optional
+            Expected number of values, when it is already known. The data
+            is then checked against it instead of querying the server for
+            the size and the component count of the field.
+        """
+        if data_size is not None:
+            data = np.ascontiguousarray(data, dtype=float).ravel()
+            if data.size != data_size:
+                raise ValueError(
+                    f"An array of size {data_size} is expected and "
+                    f"size {data.size} was input"
+                )
+        elif isinstance(data, (np.ndarray, np.generic)):
+            if (
+                0 != self.size
+                and self.component_count > 1
+                and data.size // self.component_count
+                != data.size / self.component_count
+            ):
+                raise ValueError(
+                    f"An array of shape {self.shape} is expected and "
+                    f"shape {data.shape} was input"
+                )
+            data = np.ascontiguousarray(data, dtype=float).ravel()
+        else:
+            data = np.array(data, dtype=float).ravel()
+        metadata = [("float_or_double", "double"), ("size_double", f"{len(data)}")]
+        self._update_data(data, metadata)
+
+    def _update_data(self, data, metadata):
+        """Stream the flat array ``data`` to the server in chunks."""
         request = field_pb2.UpdateDataRequest()
         request.field.CopyFrom(self._message)
         self._stub.UpdateData(
@@ -5,14 +5,29 @@ fields_factory
 Contains functions to simplify creating fields.
 """
 
+import functools
+import numbers
+
 from ansys.dpf import core
 from ansys.dpf.core.common import natures, locations
 from ansys.dpf.core import Field
-from ansys.dpf.core.dimensionality import Dimensionality
 from ansys.grpc.dpf import field_pb2, field_pb2_grpc, base_pb2
 
 import numpy as np
 
+# number of components per entity for the natures with a fixed size
+_elem_data_sizes = {
+    natures.scalar.name: 1,
+    natures.vector.name: 3,
+    natures.symmatrix.name: 6,
+}
+
+# field nature by number of columns of the arrays given to field_from_array
+_array_natures = {1: natures.scalar, 3: natures.vector, 6: natures.symmatrix}
+
+# protobuf nature enum values by nature name
+_nature_values = {n.name: base_pb2.Nature.Value(n.name.upper()) for n in natures}
+
 
 def field_from_array(arr):
     """Create a DPF vector or scalar field from a numpy array or a Python list.
@@ -27,13 +42,15 @@ def field_from_array(arr):
     field : Field
         Field constructed from the array.
     """
-    from ansys.dpf.core import Field, natures
-
     arr = np.asarray(arr)
 
     if not np.issubdtype(arr.dtype, np.number):
         raise TypeError("Array must be a numeric type")
 
+    # the field data is sent as contiguous doubles: convert once here
+    # (no copy when the input already matches) instead of in the setter
+    arr = np.ascontiguousarray(arr, dtype=np.float64)
+
     shp_err = ValueError(
         "Array must be either contain 1 dimension or "
         "2 dimensions with three components."
@@ -41,25 +58,31 @@ def field_from_array(arr):
     if arr.ndim == 1:
         nature = natures.scalar
     elif arr.ndim == 2:
-        if arr.shape[1] == 1:
-            arr = arr.ravel()
-            nature = natures.scalar
-        elif arr.shape[1] == 3:
-            nature = natures.vector
-        elif arr.shape[1] == 6:
-            nature = natures.symmatrix
-        else:
+        nature = _array_natures.get(arr.shape[1])
+        if nature is None:
             raise shp_err
+        if nature is natures.scalar:
+            arr = arr.ravel()
     else:
         raise shp_err
 
     n_entities = arr.shape[0]
-    field = Field(nentities=n_entities, nature=nature)
-    field.data = arr
-    field.scoping.ids = np.arange(1, n_entities + 1)
+    field = _create_field(None, nature, n_entities, data=arr)
+    field.scoping.ids = _entity_ids(n_entities)
     return field
 
 
+@functools.lru_cache(maxsize=4)
+def _entity_ids(n_entities):
+    """Scoping IDs ``1..n_entities`` shared between fields of the same size.
+
+    The returned array is read-only and must not be modified.
+    """
+    ids = np.arange(1, n_entities + 1, dtype=np.int32)
+    ids.setflags(write=False)
+    return ids
+
+
 def create_matrix_field(
     num_entities, num_lines, num_col, location=locations.nodal, server=None
 ):
@@ -264,16 +287,101 @@ def create_vector_field(num_entities, num_comp, location=locations.nodal, server
     )
 
 
+def _ensure_int_shape(shape):
+    """Convert integer-like shape elements, such as numpy integers, to ``int``.
+
+    Raises
+    ------
+    TypeError
+        If an element is not an integer or is a boolean.
+    """
+    if not all(
+        isinstance(dim, numbers.Integral) and not isinstance(dim, bool) for dim in shape
+    ):
+        raise TypeError("all shape elements must be ints")
+    return tuple(int(dim) for dim in shape)
+
+
+def create_fields(specs, server=None):
+    """Create several :class:`ansys.dpf.core.Field` at once.
+
+    All the creation requests are sent before waiting for the first
+    answer, so creating many fields costs about one server round-trip
+    instead of one per field.
+
+    Parameters
+    ----------
+    specs : list of tuple
+        One ``(nature, num_entities[, location[, ncomp_n[, ncomp_m]]])`` tuple
+        per field, with these items:
+
+        - ``nature``: nature of the entity data, for example
+          :class:`ansys.dpf.core.natures.scalar` or
+          :class:`ansys.dpf.core.natures.matrix`.
+        - ``num_entities``: number of entities to reserve.
+        - ``location``: location of the field. The default is ``"Nodal"``.
+        - ``ncomp_n``: number of columns of a ``matrix`` nature, or number of
+          components of a ``vector`` nature. The default is ``0``, which keeps
+          the default size of the nature.
+        - ``ncomp_m``: number of lines of a ``matrix`` nature. The default
+          is ``0``.
+
+        A ``matrix`` nature has no default size, so it needs both
+        ``ncomp_n`` and ``ncomp_m``.
+    server : ansys.dpf.core.server, optional
+        Server with the channel connected to the remote or local instance.
+        The default is ``None``, in which case an attempt is made to use the
+        global server.
+
+    Returns
+    -------
+    fields : list of Field
+        DPF fields in the requested formats, in the order of ``specs``.
+
+    Examples
+    --------
+    Create a scalar field of 4 entities and a 3D vector field of 2 entities
+    with a nodal location (default).
+
+    >>> from ansys.dpf.core import fields_factory
+    >>> from ansys.dpf.core.common import natures
+    >>> fields = fields_factory.create_fields([(natures.scalar, 4), (natures.vector, 2)])
+
+    Create an elemental field of 5 matrices of 3 lines and 2 columns.
+
+    >>> from ansys.dpf.core.common import locations
+    >>> fields = fields_factory.create_fields([(natures.matrix, 5, locations.elemental, 2, 3)])
+
+    """
+    stub = _connect(server)
+    requests = [_field_request(*spec) for spec in specs]
+    futures = [stub.Create.future(request) for request in requests]
+    return [Field(field=future.result(), server=server) for future in futures]
+
+
 def _connect(server):
-    """Connect to the gRPC instance."""
+    """Connect to the gRPC instance.
+
+    The stub is built once per server and stored on it, so it shares the
+    server's lifetime.
+    """
     if server is None:
         server = core._global_server()
-    stub = field_pb2_grpc.FieldServiceStub(server.channel)
+    stub = server._fields_factory_stub
+    if stub is None:
+        stub = field_pb2_grpc.FieldServiceStub(server.channel)
+        server._fields_factory_stub = stub
     return stub
 
 
 def _create_field(
-    server, nature, nentities, location=locations.nodal, ncomp_n=0, ncomp_m=0
+    server,
+    nature,
+    nentities,
+    location=locations.nodal,
+    ncomp_n=0,
+    ncomp_m=0,
+    data=None,
 ):
     """Create a specific :class:`ansys.dpf.core.Field`.
 
@@ -305,48 +413,56 @@ def _create_field(
         Number of lines.
     ncomp_m : int
         Number of columns.
+    data : np.ndarray, optional
+        Flat or entity-shaped data to upload right after the field is created.
+        The array is streamed as raw bytes; it is not copied when it is already
+        a contiguous ``float64`` array.
 
     Returns
     -------
     field : Field
         DPF field in the requested format.
     """
-    # ncomp_n is number of column components
-    # ncomp_m is number of line components
     # connect to grpc
     stub = _connect(server)
+    request = _field_request(nature, nentities, location, ncomp_n, ncomp_m)
+    # get field
+    message = stub.Create(request)
+    field = Field(field=message, server=server)
+    if data is not None:
+        field._set_double_data(data, request.size.data_size)
+    return field
+
+
+def _field_request(nature, nentities, location=locations.nodal, ncomp_n=0, ncomp_m=0):
+    """Build the request creating a field, see :func:`_create_field`."""
+    # ncomp_n is number of column components
+    # ncomp_m is number of line components
+    nentities, ncomp_n, ncomp_m = _ensure_int_shape((nentities, ncomp_n, ncomp_m))
     # set nature
     if hasattr(nature, "name"):
         snature = nature.name
     else:
         snature = nature
 
-    if snature == natures.vector.name:
-        elem_data_size = 3
-    elif snature == natures.symmatrix.name:
-        elem_data_size = 6
-    elif snature == natures.scalar.name:
-        elem_data_size = 1
-    elif snature == natures.matrix.name:
-        elem_data_size = ncomp_n * ncomp_m
-    else:
-        elem_data_size = ncomp_n
-    if ncomp_n != 0 and ncomp_m != 0:
-        dimensionality = Dimensionality([ncomp_n, ncomp_m], nature)
-    elif ncomp_n != 0 and ncomp_m == 0:
-        dimensionality = Dimensionality([ncomp_n], nature)
-    else:
-        dimensionality = None
+    elem_data_size = _elem_data_sizes.get(snature)
+    if elem_data_size is None:
+        if snature == natures.matrix.name:
+            elem_data_size = ncomp_n * ncomp_m
+        else:
+            elem_data_size = ncomp_n
     # set request
     request = field_pb2.FieldRequest()
-    nature = base_pb2.Nature.Value(snature.upper())
+    nature = _nature_values[snature]
     request.nature = nature
     request.location.location = location
     request.size.scoping_size = nentities
-    if dimensionality is not None:
-        request.dimensionality.CopyFrom(dimensionality._parse_dim_to_message())
+    if ncomp_n != 0:
+        # fill the dimensionality in place instead of copying a message
+        # built from a Dimensionality
+        request.dimensionality.size.append(ncomp_n)
+        if ncomp_m != 0:
+            request.dimensionality.size.append(ncomp_m)
+        request.dimensionality.nature = nature
     request.size.data_size = nentities * elem_data_size
-    # get field
-    message = stub.Create(request)
-    field = Field(field=message, server=server)
-    return field
+    return request
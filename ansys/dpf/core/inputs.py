@@ -1,3 +1,4 @@
+import functools
 from textwrap import wrap
 from ansys.dpf.core.mapping_types import map_types_to_python
 from ansys.dpf.core.outputs import _Outputs, Output
@@ -23,13 +24,9 @@ class Input:
         self._operator = operator
         self._pin = pin
         self._count_ellipsis = count_ellipsis
-        self._python_expected_types = []
-        for cpp_type in self._spec.type_names:
-            python_type = map_types_to_python[cpp_type]
-            if python_type not in self._python_expected_types:
-                self._python_expected_types.append(map_types_to_python[cpp_type])
-        if len(self._spec.type_names) == 0:
-            self._python_expected_types.append("Any")
+        self._python_expected_types = _expected_python_types(
+            tuple(self._spec.type_names)
+        )
         docstr = self.__str__()
         self.name = self._spec.name
         if self._count_ellipsis != -1:
@@ -113,7 +110,9 @@ class Input:
         self.connect(inpt)
 
     def _update_doc_str(self, docstr, class_name):
-        """Dynamically update the docstring of this instance by creating a class on the fly.
+        """Dynamically update the docstring of this instance by switching it to a class on the fly.
+
+        The class is shared by all the inputs with the same name and docstring.
 
         Parameters
         ----------
@@ -121,12 +120,11 @@ class Input:
 
         class_name :
         """
-        child_class = type(class_name, (self.__class__,), {"__doc__": docstr})
-        self.__class__ = child_class
+        self.__class__ = _documented_class(self.__class__, class_name, docstr)
 
     def __str__(self):
         docstr = self._spec.name + " : "
-        type_info = self._python_expected_types.copy()
+        type_info = list(self._python_expected_types)
         if self._spec.optional:
             type_info += ["optional"]
         docstr += ", ".join(type_info) + "\n"
@@ -145,6 +143,20 @@ class Input:
                 )
 
 
+@functools.lru_cache(maxsize=None)
+def _expected_python_types(type_names):
+    """Python type names accepted by an input pin, ``("Any",)`` if it has no type."""
+    if not type_names:
+        return ("Any",)
+    return tuple(dict.fromkeys(map_types_to_python[cpp_type] for cpp_type in type_names))
+
+
+@functools.lru_cache(maxsize=4096)
+def _documented_class(base, class_name, docstr):
+    """Subclass of ``base`` carrying ``docstr``, shared by every input pin with that doc."""
+    return type(class_name, (base,), {"__doc__": docstr})
+
+
 class _Inputs:
     def __init__(self, dict_inputs, operator):
         self._dict_inputs = dict_inputs
@@ -8,6 +8,27 @@ Contains functions to simplify creating mesh scopings.
 from ansys.dpf.core import Scoping
 from ansys.dpf.core import errors as dpf_errors
 from ansys.dpf.core.common import locations
+from ansys.dpf.core.scoping import _fits_int32
+
+import numpy as np
+
+
+def _as_ids(ids, parameter_name):
+    """Convert a list or an array of IDs to a 1D int32 array, copying only if needed.
+
+    IDs that are not integers or do not fit in an int32 are rejected
+    instead of being cast.
+    """
+    ids = np.asarray(ids)
+    if ids.size == 0:
+        ids = ids.astype(np.int32)
+    if (
+        ids.ndim != 1
+        or not np.issubdtype(ids.dtype, np.integer)
+        or not _fits_int32(ids)
+    ):
+        raise dpf_errors.InvalidTypeError("list or 1D array of int", parameter_name)
+    return np.ascontiguousarray(ids, dtype=np.int32)
 
 
 def nodal_scoping(node_ids, server=None):
@@ -15,8 +36,8 @@ def nodal_scoping(node_ids, server=None):
 
     Parameters
     ----------
-    node_ids : List of int
-        List of IDs for the nodes.
+    node_ids : list of int or numpy.ndarray
+        List or 1D array of IDs for the nodes.
     server : ansys.dpf.core.server, optional
         Server with the channel connected to the remote or local instance.
         The default is ``None``, in which case an attempt is made to use the
@@ -26,9 +47,8 @@ def nodal_scoping(node_ids, server=None):
     -------
     scoping : ansys.dpf.core.Scoping
     """
-    if not isinstance(node_ids, list):
-        raise dpf_errors.InvalidTypeError("list", "node_ids")
-    scoping = Scoping(server=server, ids=node_ids, location=locations.nodal)
+    ids = _as_ids(node_ids, "node_ids")
+    scoping = Scoping(server=server, ids=ids, location=locations.nodal)
     return scoping
 
 
@@ -37,8 +57,8 @@ def elemental_scoping(element_ids, server=None):
 
     Parameters
     ----------
-    element_ids : List of int
-        List of IDs for the elements.
+    element_ids : list of int or numpy.ndarray
+        List or 1D array of IDs for the elements.
     server : ansys.dpf.core.server, optional
         Server with the channel connected to the remote or local instance.
         The default is ``None``, in which case an attempt is made to use the
@@ -48,9 +68,8 @@ def elemental_scoping(element_ids, server=None):
     -------
     scoping : ansys.dpf.core.Scoping
     """
-    if not isinstance(element_ids, list):
-        raise dpf_errors.InvalidTypeError("list", "element_ids")
-    scoping = Scoping(server=server, ids=element_ids, location=locations.elemental)
+    ids = _as_ids(element_ids, "element_ids")
+    scoping = Scoping(server=server, ids=ids, location=locations.elemental)
     return scoping
 
 
@@ -10,10 +10,29 @@ Module contains the Model class to manage file result models.
 
 from ansys import dpf
 from ansys.dpf.core import Operator
+from ansys.dpf.core import errors
 from ansys.dpf.core.common import types
 from ansys.dpf.core.data_sources import DataSources
 from ansys.dpf.core.results import Results
-from grpc._channel import _InactiveRpcError
+
+_NO_RESULT_FILE_MSG = "results file is not defined in the Data sources"
+
+_HAS_STREAMS_PROVIDER_OP = None
+
+
+def _has_streams_provider_op():
+    """Whether the ``streams_provider`` operator wrapper is available.
+
+    The ``operators`` package is only probed on the first call.
+    """
+    global _HAS_STREAMS_PROVIDER_OP
+    if _HAS_STREAMS_PROVIDER_OP is None:
+        from ansys.dpf.core import operators
+
+        _HAS_STREAMS_PROVIDER_OP = hasattr(operators, "metadata") and hasattr(
+            operators.metadata, "streams_provider"
+        )
+    return _HAS_STREAMS_PROVIDER_OP
 
 
 class Model:
@@ -38,6 +57,8 @@ class Model:
 
     """
 
+    __slots__ = ("_server", "_metadata", "_results")
+
     def __init__(self, data_sources=None, server=None):
         """Initialize connection with DPF server."""
 
@@ -223,14 +244,27 @@ class Metadata:
 
     """
 
+    __slots__ = (
+        "_server",
+        "_data_sources",
+        "_meshed_region",
+        "_mesh_provider",
+        "result_info",
+        "_stream_provider",
+        "_time_freq_support",
+        "_time_freq_count",
+    )
+
     def __init__(self, data_sources, server):
         self._server = server
-        self._set_data_sources(data_sources)
         self._meshed_region = None
+        self._mesh_provider = None
         self.result_info = None
         self._stream_provider = None
         self._time_freq_support = None
-        self._cache_streams_provider()
+        self._time_freq_count = None
+        # also creates the streams provider
+        self._set_data_sources(data_sources)
         self._cache_result_info()
 
     def _cache_result_info(self):
@@ -241,9 +275,7 @@ class Metadata:
         """Create a stream provider and cache it."""
         from ansys.dpf.core import operators
 
-        if hasattr(operators, "metadata") and hasattr(
-            operators.metadata, "stream_provider"
-        ):
+        if _has_streams_provider_op():
             self._stream_provider = operators.metadata.streams_provider(
                 data_sources=self._data_sources, server=self._server
             )
@@ -286,13 +318,22 @@ class Metadata:
 
         """
         if self._time_freq_support is None:
-            timeProvider = Operator("TimeFreqSupportProvider", server=self._server)
-            timeProvider.inputs.connect(self._stream_provider.outputs)
-            self._time_freq_support = timeProvider.get_output(
-                0, types.time_freq_support
-            )
+            self._time_freq_support = self._load_time_freq_support()
         return self._time_freq_support
 
+    @property
+    def _n_time_freqs(self):
+        """Number of time frequencies of the time frequency support."""
+        if self._time_freq_count is None:
+            self._time_freq_count = len(self.time_freq_support.time_frequencies)
+        return self._time_freq_count
+
+    def _load_time_freq_support(self):
+        """Returns a time frequency support object"""
+        timeProvider = Operator("TimeFreqSupportProvider", server=self._server)
+        timeProvider.inputs.connect(self._stream_provider.outputs)
+        return timeProvider.get_output(0, types.time_freq_support)
+
     @property
     def data_sources(self):
         """Data sources instance.
@@ -360,9 +401,9 @@ class Metadata:
         op.inputs.connect(self._stream_provider.outputs)
         try:
             result_info = op.get_output(0, types.result_info)
-        except _InactiveRpcError as e:
+        except errors.DPFServerException as e:
             # give the user a more helpful error
-            if "results file is not defined in the Data sources" in e.details():
+            if _NO_RESULT_FILE_MSG in str(e):
                 raise RuntimeError("Unable to open result file") from None
             else:
                 raise e
@@ -380,7 +421,9 @@ class Metadata:
         # NOTE: this uses the cached mesh and we might consider
         # changing this
         if self._meshed_region is None:
-            self._meshed_region = self.mesh_provider.get_output(0, types.meshed_region)
+            self._meshed_region = self._cached_mesh_provider.get_output(
+                0, types.meshed_region
+            )
             self._meshed_region._set_stream_provider(self._stream_provider)
 
         return self._meshed_region
@@ -398,16 +441,39 @@ class Metadata:
         mesh_provider : class:`ansys.dpf.core.operators.mesh.mesh_provider`
             Mesh provider operator.
 
+        """
+        self._run_selection_manager_provider()
+        mesh_provider = Operator("MeshProvider", server=self._server)
+        mesh_provider.inputs.connect(self._stream_provider.outputs)
+        return mesh_provider
+
+    @property
+    def _cached_mesh_provider(self):
+        """Mesh provider operator reused internally.
+
+        This operator is never handed out to users, so its inputs are
+        only connected by this module.
+        """
+        if self._mesh_provider is None:
+            self._mesh_provider = self.mesh_provider
+        return self._mesh_provider
+
+    def _run_selection_manager_provider(self):
+        """Run the ``MeshSelectionManagerProvider`` operator on the streams.
+
+        Servers that do not provide this operator are probed again on each
+        call, so a plugin loaded later is picked up.
         """
         try:
             tmp = Operator("MeshSelectionManagerProvider", server=self._server)
-            tmp.inputs.connect(self._stream_provider.outputs)
+        except Exception:
+            return
+        tmp.inputs.connect(self._stream_provider.outputs)
+        try:
             tmp.run()
-        except:
+        except Exception:
+            # the mesh provider works without a selection manager
             pass
-        mesh_provider = Operator("MeshProvider", server=self._server)
-        mesh_provider.inputs.connect(self._stream_provider.outputs)
-        return mesh_provider
 
     @property
     def available_named_selections(self):
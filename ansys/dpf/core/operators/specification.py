@@ -3,6 +3,8 @@ import os
 
 
 class PinSpecification:
+    __slots__ = ("name", "type_names", "document", "optional", "ellipsis")
+
     def __init__(self, name = None, type_names = None, optional = None, document = None, ellipsis = None):
         self.name = name
         self.type_names = type_names
@@ -1,6 +1,7 @@
 from ansys.dpf.core.mapping_types import map_types_to_python
 from ansys.dpf.core.common import types
 from ansys.grpc.dpf import operator_pb2
+import functools
 import re
 
 
@@ -19,9 +20,7 @@ class Output:
         self._spec = spec
         self._operator = operator
         self._pin = pin
-        self._python_expected_types = []
-        for cpp_type in self._spec.type_names:
-            self._python_expected_types.append(map_types_to_python[cpp_type])
+        self._python_expected_types = _python_types(tuple(self._spec.type_names))
 
     def get_data(self):
         """Retrieves the output of the operator."""
@@ -53,6 +52,12 @@ class Output:
         return docstr
 
 
+@functools.lru_cache(maxsize=None)
+def _python_types(type_names):
+    """Python type names of the C++ ``type_names`` of a pin specification."""
+    return tuple(map_types_to_python[cpp_type] for cpp_type in type_names)
+
+
 class _Outputs:
     """
     Parameters
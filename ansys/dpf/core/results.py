@@ -5,11 +5,11 @@ Results
 ========
 This module contains the Results and Result classes that are created by the model
 to easily access results in result files."""
-import functools
-
+import numpy as np
 
 from ansys.dpf.core import Operator
 from ansys.dpf.core import errors
+from ansys.dpf.core import operators
 from ansys.dpf.core.scoping import Scoping
 from ansys.dpf.core.custom_fields_container import (
     ElShapeFieldsContainer,
@@ -17,6 +17,76 @@ from ansys.dpf.core.custom_fields_container import (
 )
 
 
+def _operator_doc(operator_name, server, operator=None):
+    """Description of the ``operator_name`` operator on ``server``.
+
+    Descriptions are stored on the server instance, so each operator is
+    only described once per server. ``operator``, an existing instance of
+    that operator, is described instead of creating a new one.
+    """
+    docs = server._operator_docs
+    doc = docs.get(operator_name)
+    if doc is None:
+        if operator is None:
+            operator = Operator(operator_name, server=server)
+        doc = operator.__str__()
+        docs[operator_name] = doc
+    return doc
+
+
+def _operator_available(operator_name, server):
+    """Whether ``server`` provides the ``operator_name`` operator.
+
+    Available operators are recorded on the server instance, so each of
+    them is only probed once per server. Missing operators are probed
+    again, as a library loaded later may provide them.
+    """
+    available = server._available_operators
+    if operator_name in available:
+        return True
+    try:
+        Operator(operator_name, server=server)
+    except errors.DPFServerException:
+        return False
+    available.add(operator_name)
+    return True
+
+
+def _time_scoping_as_list(time_scoping):
+    """Convert a numpy array of time sets or frequencies to a list.
+
+    A time scoping is sent inline with the connection, which takes lists.
+    Other time scopings are returned unchanged.
+    """
+    if isinstance(time_scoping, np.ndarray):
+        return time_scoping.ravel().tolist()
+    return time_scoping
+
+
+class _ResultDoc:
+    """Docstring of the ``Result`` class, and of its operator for instances.
+
+    The operator of a result is only described when the docstring of that
+    result is read, for example by ``help()``.
+    """
+
+    def __init__(self, doc):
+        self._doc = doc
+
+    def __get__(self, obj, objtype=None):
+        if obj is None or not hasattr(obj, "_operator"):
+            return self._doc
+        try:
+            doc = _operator_doc(
+                obj._result_info.operator_name, obj._model._server, obj._operator
+            )
+        except errors.DPFServerException:
+            return self._doc
+        # the instance attribute now takes precedence over this descriptor
+        obj.__dict__["__doc__"] = doc
+        return doc
+
+
 class Results:
     """Organizes the results from DPF into accessible methods.
 
@@ -89,10 +159,10 @@ class Results:
     """  # noqa: E501
 
     def __init__(self, model):
-        self.__class__ = type(Results.__name__ + str(id(self)), (Results,), {})
-
         self._result_info = model.metadata.result_info
         self._model = model
+        self._op_map_rev = {}
+        self._op_names = []
         self._connect_operators()
 
     def __result__(self, result_type, *args):
@@ -120,39 +190,37 @@ class Results:
         if self._result_info is None:
             return
         # dynamically add function based on input type
-        self._op_map_rev = {}
         for result_type in self._result_info:
-            try:
-                doc = Operator(
-                    result_type.operator_name, server=self._model._server
-                ).__str__()
-                bound_method = self.__result__
-                method2 = functools.partial(bound_method, result_type)
-                setattr(self.__class__, result_type.name, property(method2, doc=doc))
-
-                self._op_map_rev[result_type.name] = result_type.name
-            except errors.DPFServerException:
-                pass
-            except Exception as e:
-                print(result_type.name)
-                raise e
+            # the operator is only described once its result is used
+            if not _operator_available(result_type.operator_name, self._model._server):
+                continue
+            self._op_map_rev[result_type.name] = result_type
+            self._op_names.append(result_type.name)
+
+    def __getattr__(self, name):
+        # only called for missing attributes, the results are looked up here
+        result_type = self.__dict__.get("_op_map_rev", {}).get(name)
+        if result_type is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        return self.__result__(result_type)
+
+    def __dir__(self):
+        return list(super().__dir__()) + self._op_names
 
     def __str__(self):
         return str(self._result_info)
 
     def __iter__(self):
-        for key in self._op_map_rev:
-            yield self.__class__.__dict__[key].fget()
+        for result_type in self._op_map_rev.values():
+            yield self.__result__(result_type)
 
     def __getitem__(self, val):
-        n = 0
-        for key in self._op_map_rev:
-            if n == val:
-                return self.__class__.__dict__[key].fget()
-            n += 1
+        return self.__result__(self._op_map_rev[self._op_names[val]])
 
     def __len__(self):
-        return len(self._op_map_rev)
+        return len(self._op_names)
 
 
 class Result:
@@ -189,6 +257,8 @@ class Result:
 
     """
 
+    __doc__ = _ResultDoc(__doc__)
+
     def __init__(self, model, result_info):
         self._model = model
         self._time_scoping = None
@@ -196,15 +266,10 @@ class Result:
         self._location = None
         self._result_info = result_info
         self._specific_fc_type = None
-        from ansys.dpf.core import operators
+        self._splitter = None
 
         try:
-            # create the operator to read its documentation
-            # if the operator doesn't exist, the method will not be added
-            doc = Operator(
-                self._result_info.operator_name, server=self._model._server
-            ).__str__()
-            self.__doc__ = doc
+            # if the operator doesn't exist, the result is left without operator
             if hasattr(operators, "result") and hasattr(
                 operators.result, self._result_info.name
             ):
@@ -225,6 +290,7 @@ class Result:
 
     def __call__(self, time_scoping=None, mesh_scoping=None):
         op = self._operator
+        time_scoping = _time_scoping_as_list(time_scoping)
         if time_scoping:
             op.inputs.time_scoping(time_scoping)
         elif self._time_scoping:
@@ -284,9 +350,7 @@ class Result:
         [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20]
 
         """
-        self._time_scoping = list(
-            range(1, len(self._model.metadata.time_freq_support.time_frequencies) + 1)
-        )
+        self._time_scoping = list(range(1, self._model.metadata._n_time_freqs + 1))
         return self
 
     @property
@@ -328,9 +392,7 @@ class Result:
         [20]
 
         """
-        self._time_scoping = len(
-            self._model.metadata.time_freq_support.time_frequencies
-        )
+        self._time_scoping = self._model.metadata._n_time_freqs
         return self
 
     def on_time_scoping(self, time_scoping):
@@ -338,7 +400,7 @@ class Result:
 
         Parameters
         ----------
-        time_scoping :  float, list[float], int, list[int], Scoping
+        time_scoping :  float, list[float], int, list[int], numpy.ndarray, Scoping
             One or more times or frequencies.
 
         Returns
@@ -367,7 +429,7 @@ class Result:
         array([0.115, 0.125])
 
         """
-        self._time_scoping = time_scoping
+        self._time_scoping = _time_scoping_as_list(time_scoping)
         return self
 
     def on_named_selection(self, named_selection):
@@ -453,25 +515,27 @@ class Result:
 
     def _add_split_on_property_type(self, prop):
         previous_mesh_scoping = self._mesh_scoping
-        from ansys.dpf.core import operators
-
-        if hasattr(operators, "scoping") and hasattr(
-            operators.scoping, "split_on_property_type"
-        ):
-            self._mesh_scoping = operators.scoping.split_on_property_type()
-        else:
-            self._mesh_scoping = Operator("scoping::by_property")
-
-        self._mesh_scoping.inputs.requested_location(
-            self._result_info.native_scoping_location
-        )
-        self._mesh_scoping.inputs.mesh(self._model.metadata.mesh_provider)
-        self._mesh_scoping.inputs.label1(prop)
-        if previous_mesh_scoping:
+        if self._splitter is None:
+            if hasattr(operators, "scoping") and hasattr(
+                operators.scoping, "split_on_property_type"
+            ):
+                self._splitter = operators.scoping.split_on_property_type()
+            else:
+                self._splitter = Operator("scoping::by_property")
+
+            self._splitter.inputs.requested_location(
+                self._result_info.native_scoping_location
+            )
+            self._splitter.inputs.mesh(self._model.metadata._cached_mesh_provider)
+
+        # switching between splits only changes the property of the splitter
+        self._splitter.inputs.label1(prop)
+        if previous_mesh_scoping and previous_mesh_scoping is not self._splitter:
             try:
-                self._mesh_scoping.inputs.mesh_scoping(previous_mesh_scoping)
+                self._splitter.inputs.mesh_scoping(previous_mesh_scoping)
             except:
                 pass
+        self._mesh_scoping = self._splitter
         return self
 
     def on_mesh_scoping(self, mesh_scoping):
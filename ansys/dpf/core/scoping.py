@@ -11,6 +11,7 @@ import sys
 import numpy as np
 from ansys.dpf.core.check_version import server_meet_version, version_requires
 from ansys.dpf.core.common import _common_progress_bar, locations
+from ansys.dpf.core import errors
 from ansys.dpf.core.misc import DEFAULT_FILE_CHUNK_SIZE
 from ansys.grpc.dpf import base_pb2, scoping_pb2, scoping_pb2_grpc
 
@@ -72,7 +73,7 @@ class Scoping:
         else:
             self._message = scoping
 
-        if ids:
+        if ids is not None and len(ids) != 0:
             self.ids = ids
         if location:
             self.location = location
@@ -131,7 +132,11 @@ class Scoping:
         elif not isinstance(ids, (np.ndarray, np.generic)):
             ids = np.array(ids, dtype=np.int32)
         else:
-            ids = np.array(list(ids), dtype=np.int32)
+            if not np.issubdtype(ids.dtype, np.integer):
+                raise errors.InvalidTypeError("array of int", "ids")
+            if not _fits_int32(ids):
+                raise OverflowError("IDs must fit in a signed 32-bit integer.")
+            ids = np.ascontiguousarray(ids, dtype=np.int32).ravel()
 
         metadata = [("size_int", f"{len(ids)}")]
         request = scoping_pb2.UpdateIdsRequest()
@@ -350,7 +355,16 @@ class Scoping:
         return scop
 
 
+def _fits_int32(ids):
+    """Whether all the values of the integer array ``ids`` fit in an int32."""
+    if ids.dtype == np.int32 or ids.size == 0:
+        return True
+    int32_info = np.iinfo(np.int32)
+    return int32_info.min <= ids.min() and ids.max() <= int32_info.max
+
+
 def _data_chunk_yielder(request, data, chunk_size=DEFAULT_FILE_CHUNK_SIZE):
+    data = data.ravel()
     length = data.size
     need_progress_bar = length > 1e6
     if need_progress_bar:
@@ -366,8 +380,9 @@ def _data_chunk_yielder(request, data, chunk_size=DEFAULT_FILE_CHUNK_SIZE):
     if length - sent_length < unitary_size:
         unitary_size = length - sent_length
     while sent_length < length:
-        currentcopy = data.take(range(sent_length, sent_length + unitary_size))
-        request.array = currentcopy.tobytes()
+        # slice the flat buffer instead of ``take``-ing an index range so
+        # the only copy made is the one into the protobuf bytes payload
+        request.array = data[sent_length : sent_length + unitary_size].tobytes()
         sent_length = sent_length + unitary_size
         if length - sent_length < unitary_size:
             unitary_size = length - sent_length
@@ -339,6 +339,17 @@ class DpfServer:
         self._input_ip = ip
         self._input_port = port
         self._own_process = launch_server
+        self._clear_caches()
+
+    def _clear_caches(self):
+        """Reset the client-side caches of this server.
+
+        They hold answers that depend on the operators loaded on the
+        server, so they are reset whenever a library is loaded.
+        """
+        self._operator_docs = {}
+        self._available_operators = set()
+        self._fields_factory_stub = None
 
     @property
     def _base_service(self):
@@ -1,5 +1,5 @@
 from ansys.dpf.core import errors as dpf_errors
-from ansys.dpf.core.common import locations
+from ansys.dpf.core.common import locations, natures
 from ansys.dpf.core import Model
 
 from ansys.dpf.core import fields_factory
@@ -18,6 +18,16 @@ def test_create_matrix_field():
     assert comp_count == 10
 
 
+def test_create_field_numpy_int_shape():
+    f = fields_factory.create_matrix_field(np.int64(3), np.int32(2), np.int64(5))
+    assert f.component_count == 10
+    with pytest.raises(TypeError):
+        fields_factory.create_scalar_field(4.0)
+    # protobuf takes True as 1, booleans are rejected before the request
+    with pytest.raises(TypeError):
+        fields_factory.create_scalar_field(True)
+
+
 def test_create_tensor_field():
     f = fields_factory.create_tensor_field(4)
     assert f is not None
@@ -59,6 +69,30 @@ def test_create_3d_vector_field():
     _vector_comparison(f)
 
 
+def test_field_from_array_non_contiguous():
+    arr = np.arange(12, dtype=np.int64).reshape(3, 4)[:, 1:]
+    f = fields_factory.field_from_array(arr)
+    assert f.component_count == 3
+    assert np.allclose(f.data, arr)
+    assert np.allclose(f.scoping.ids, [1, 2, 3])
+
+
+def test_create_fields():
+    fields = fields_factory.create_fields(
+        [
+            (natures.scalar, 4),
+            (natures.symmatrix, 2, locations.elemental),
+            (natures.matrix, 5, locations.nodal, 2, 3),
+        ]
+    )
+    assert len(fields) == 3
+    assert fields[0].component_count == 1
+    assert fields[1].component_count == 6
+    assert fields[1].location == locations.elemental
+    assert fields[2].component_count == 6
+    assert fields[2].location == locations.nodal
+
+
 def test_over_time_freq_fields_container_1():
     f1 = fields_factory.create_scalar_field(25)
     f2 = fields_factory.create_scalar_field(31)
@@ -252,6 +286,18 @@ def test_nodal_scoping():
     assert scop.location == locations.nodal
 
 
+def test_nodal_scoping_from_array():
+    scop = mesh_scoping_factory.nodal_scoping(np.array([2, 5, 10], dtype=np.int64))
+    assert np.allclose(scop.ids, [2, 5, 10])
+    assert scop.location == locations.nodal
+    with pytest.raises(dpf_errors.InvalidTypeError):
+        mesh_scoping_factory.nodal_scoping(np.ones((2, 2), dtype=np.int32))
+    with pytest.raises(dpf_errors.InvalidTypeError):
+        mesh_scoping_factory.nodal_scoping(np.array([1.9, 2.5]))
+    with pytest.raises(dpf_errors.InvalidTypeError):
+        mesh_scoping_factory.nodal_scoping(np.array([2 ** 33 + 5], dtype=np.int64))
+
+
 def test_elemental_scoping():
     scop = mesh_scoping_factory.elemental_scoping([2, 7, 11])
     assert scop is not None
@@ -5,6 +5,7 @@ from ansys import dpf
 from ansys.dpf.core import examples
 from ansys.dpf.core import misc
 import functools
+import types
 
 NO_PLOTTING = True
 
@@ -108,6 +109,26 @@ def test_iterate_results_model(allkindofcomplexity):
         key()
 
 
+def test_index_results_model(allkindofcomplexity):
+    model = dpf.core.Model(allkindofcomplexity)
+    res = model.results
+    names = [result._result_info.name for result in res]
+    assert len(res) == len(names)
+    assert res[0]._result_info.name == names[0]
+    assert res[-1]._result_info.name == names[-1]
+    with pytest.raises(IndexError):
+        res[len(res)]
+
+
+def test_results_without_result_info():
+    model = types.SimpleNamespace(metadata=types.SimpleNamespace(result_info=None))
+    res = dpf.core.results.Results(model)
+    assert len(res) == 0
+    assert list(res) == []
+    with pytest.raises(IndexError):
+        res[0]
+
+
 def test_result_not_overrided(plate_msup):
     model1 = dpf.core.Model(examples.electric_therm)
     size = len(model1.results)
@@ -184,6 +205,18 @@ def test_result_time_scoping(plate_msup):
     )
 
 
+def test_result_time_scoping_array(plate_msup):
+    model = dpf.core.Model(plate_msup)
+    stress = model.results.stress
+    fc = stress.on_time_scoping(np.array([1, 2, 3, 19])).eval()
+    assert len(fc) == 4
+    fc = stress(time_scoping=np.array([0.115, 0.125])).outputs.fields_container()
+    assert len(fc) == 2
+    assert np.allclose(
+        fc.time_freq_support.time_frequencies.data, np.array([0.115, 0.125])
+    )
+
+
 def test_result_spliited_subset(allkindofcomplexity):
     model = dpf.core.Model(allkindofcomplexity)
     vol = model.results.elemental_volume
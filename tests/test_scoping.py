@@ -47,6 +47,14 @@ def test_set_get_ids_long_scoping():
     assert np.allclose(scop.ids, ids)
 
 
+def test_set_ids_invalid_array_scoping():
+    scop = Scoping()
+    with pytest.raises(OverflowError):
+        scop.ids = np.array([1, 2 ** 33 + 5], dtype=np.int64)
+    with pytest.raises(dpf_errors.InvalidTypeError):
+        scop.ids = np.array([1.9, 2.5])
+
+
 def test_get_location_scoping():
     scop = Scoping()
     scop._set_location("Nodal")